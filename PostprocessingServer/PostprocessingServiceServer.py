@@ -492,7 +492,8 @@ async def upload_log_to_s3(request: DagRequest):
         dvc_worker.s3_client.upload_file(
             Filename=str(log_file_path),
             Bucket=dvc_worker.minio_bucket,
-            Key=target_path
+            Key=target_path,
+            Config=dvc_worker.transfer_config
         )
 
         logger.info("Log file uploaded successfully.")
@@ -1,7 +1,7 @@
 from DVCWorker import DVCWorker
 from LoggerManager import LoggerManager
 from pathlib import Path
-import config
+from config import CFG
 import boto3
 class DVCManager:
     def __init__(self, logger_manager: LoggerManager):
@@ -15,16 +15,16 @@ class DVCManager:
             worker = DVCWorker(
                 dag_id=dag_id,
                 execution_id=execution_id,
-                minio_bucket=config.MINIO_BUCKET,
-                minio_url=config.MINIO_URL,
-                access_key=config.MINIO_ACCESS_KEY,
-                secret_key=config.MINIO_SECRET_KEY,
+                minio_bucket=CFG.minio_bucket,
+                minio_url=CFG.minio_url,
+                access_key=CFG.minio_access_key,
+                secret_key=CFG.minio_secret_key,
                 git_repo_path= Path(git_repo_path).resolve(),  # or any other path from config
                 logger=logger,
-                dataset_storage_minio_url = config.DATASET_STORAGE_MINIO_URL,
-                dataset_storage_minio_bucket= config.DATASET_STORAGE_MINIO_BUCKET,
-                dataset_storage_minio_access_key= config.DATASET_STORAGE_MINIO_ACCESS_KEY,
-                dataset_storage_minio_secret_key= config.DATASET_STORAGE_MINIO_SECRET_KEY
+                dataset_storage_minio_url = CFG.dataset_storage_minio_url,
+                dataset_storage_minio_bucket= CFG.dataset_storage_minio_bucket,
+                dataset_storage_minio_access_key= CFG.dataset_storage_minio_access_key,
+                dataset_storage_minio_secret_key= CFG.dataset_storage_minio_secret_key
 
             )
             self.workers[worker_key] = worker
@@ -1,14 +1,127 @@
 import subprocess
+import asyncio
+from dataclasses import dataclass
 from pathlib import Path
 import logging
 import boto3
-import subprocess
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
+from botocore.exceptions import BotoCoreError, ClientError
+import pygit2
 import shutil
 import os
+import hashlib
+import socket
+import threading
+import urllib3
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 from minio.error import S3Error
 from minio import Minio
 import yaml  # 解析 DVC 檔案
 from fastapi import  HTTPException
+from dvc.repo import Repo
+from dvc.exceptions import DvcException
+
+# 同時進行的 MinIO / DVC 傳輸數上限：add_and_push_many、copy_dvc_files_within_minio、pull_many 的並行數，
+# 以及 dataset 下載用 urllib3 連線池的大小
+MAX_PARALLEL_TRANSFERS = 16
+
+# S3 multipart 設定：預設 5 MiB 分段對 MinIO 太小，改用 64 MiB 分段並提高並行數
+TRANSFER_CHUNK_SIZE = 64 * 1024 * 1024
+TRANSFER_MAX_CONCURRENCY = 16
+
+# dvc add 計算檔案 hash 的執行緒數 (DVC 預設最多只用 4 條)
+DVC_CHECKSUM_JOBS = os.cpu_count() or 1
+
+
+@lru_cache(maxsize=512)
+def _resolve_absolute(path: Path) -> Path:
+    return path.resolve()
+
+
+def _resolve(path) -> Path:
+    """Path.resolve() 的快取版本，避免同一路徑重複解析 symlink 的 stat 呼叫
+
+    相對路徑的結果取決於目前工作目錄 (download_dataset_with_dvc 會 os.chdir)，因此不快取
+    """
+    path = Path(path)
+    if not path.is_absolute():
+        return path.resolve()
+    return _resolve_absolute(path)
+
+
+def _folder_fingerprint(folder_path: Path) -> str:
+    """以每個檔案的 (相對路徑, 大小, mtime_ns) 計算資料夾的快速指紋，只需 stat 不讀檔案內容"""
+    digest = hashlib.blake2b(digest_size=16)
+    for root, dirs, files in os.walk(folder_path):
+        dirs.sort()
+        for name in sorted(files):
+            path = os.path.join(root, name)
+            stat = os.stat(path)
+            digest.update(f"{os.path.relpath(path, folder_path)}\0{stat.st_size}\0{stat.st_mtime_ns}\n".encode())
+    return digest.hexdigest()
+
+
+def _copy_file(src: Path, dst: Path):
+    """複製檔案內容；Linux 上以 copy_file_range 在 kernel 內完成 (btrfs/XFS 可直接 reflink)，不支援時改用 shutil.copyfile"""
+    if hasattr(os, "copy_file_range"):
+        try:
+            with open(src, 'rb') as src_file, open(dst, 'wb') as dst_file:
+                remaining = os.fstat(src_file.fileno()).st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(src_file.fileno(), dst_file.fileno(), remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+            if remaining == 0:
+                return
+        except OSError:
+            pass
+    shutil.copyfile(src, dst)
+
+
+@lru_cache(maxsize=8)
+def _s3_client(endpoint_url: str, access_key: str, secret_key: str):
+    """依 (endpoint, access key, secret key) 共用同一個 S3 client，避免每個 DVCWorker 重新建立 client 與連線池"""
+    session = boto3.session.Session()
+    return session.client(
+        's3',
+        endpoint_url=endpoint_url,
+        aws_access_key_id=access_key,
+        aws_secret_access_key=secret_key,
+        config=Config(
+            # 預設連線池只有 10 條，不足以支撐並行上傳
+            max_pool_connections=64,
+            connect_timeout=3,
+            read_timeout=60,
+            retries={'max_attempts': 10, 'mode': 'adaptive'},
+            tcp_keepalive=True
+        )
+    )
+
+
+@lru_cache(maxsize=1)
+def _minio_http_client():
+    """dataset 下載用 Minio client 共用的連線池，保持 TCP keepalive，避免每次下載重新建立連線"""
+    return urllib3.PoolManager(
+        maxsize=MAX_PARALLEL_TRANSFERS,
+        timeout=urllib3.Timeout(connect=3, read=60),
+        retries=urllib3.Retry(total=5, backoff_factor=0.2, status_forcelist=[500, 502, 503, 504]),
+        socket_options=urllib3.connection.HTTPConnection.default_socket_options + [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
+    )
+
+@dataclass(slots=True)
+class StageLayout:
+    """一個 stage 產物資料夾在 add / push / 上傳 .dvc 時用到的路徑，每組 (資料夾, stage_type) 只計算一次"""
+    folder_path: Path       # 產物資料夾 (已 resolve)
+    parent_dir: Path        # 產物資料夾所在的 DVC repo
+    dvc_file: Path          # dvc add 產生的 .dvc 檔
+    git_stage_dir: Path     # git repo 中存放 .dvc 檔的資料夾
+    staged_dvc_file: Path   # git repo 中的 .dvc 檔
+    minio_key: str          # .dvc 檔在 MinIO 上的 key
+    state_file: Path        # 上次成功 add/push 時資料夾的指紋
+
 
 class DVCWorker:
     def __init__(
@@ -27,18 +140,38 @@ class DVCWorker:
         ):
         self.dag_id = dag_id
         self.execution_id = execution_id
-        self.git_repo_path = Path(git_repo_path).resolve()  # Git Local Path 儲存
+        self.git_repo_path = _resolve(git_repo_path)  # Git Local Path 儲存
         self.minio_bucket = minio_bucket
         self.minio_url = minio_url
         self.access_key = access_key
         self.secret_key = secret_key
         self.remote_name = f"remote_{dag_id}_{execution_id}"
-        self.s3_client = boto3.client('s3', endpoint_url=self.minio_url, aws_access_key_id=self.access_key, aws_secret_access_key=self.secret_key)
+        self.s3_client = _s3_client(self.minio_url, self.access_key, self.secret_key)
+        self.transfer_config = TransferConfig(
+            multipart_threshold=TRANSFER_CHUNK_SIZE,
+            multipart_chunksize=TRANSFER_CHUNK_SIZE,
+            max_concurrency=TRANSFER_MAX_CONCURRENCY,
+            use_threads=True
+        )
         self.logger = logger
         self.dataset_storage_minio_url = dataset_storage_minio_url
         self.dataset_storage_minio_bucket = dataset_storage_minio_bucket
         self.dataset_storage_minio_access_key = dataset_storage_minio_access_key
         self.dataset_storage_minio_secret_key = dataset_storage_minio_secret_key
+
+        # git index 為共用資源，同一時間只允許一個 commit
+        self._git_lock = threading.Lock()
+        # 同一個 DVC repo 不能同時執行 dvc add/push，每個 repo 各自一把鎖
+        self._dvc_repo_locks = {}
+        self._dvc_repo_locks_guard = threading.Lock()
+        # 已開啟的 DVC Repo，依 repo 路徑快取，避免每次操作重新啟動 dvc 並載入 repo
+        self._dvc_repos = {}
+        # 已確認存在的 bucket，worker 存活期間不再重複 head_bucket
+        self._known_buckets = set()
+        # Git 倉庫確認 (或初始化) 過一次之後就不再重複檢查
+        self._git_initialized = False
+        # (產物資料夾, folder_name, stage_type) -> StageLayout
+        self._stage_layouts = {}
         
         # 預設 dataset storage 是存在地端 所以先不用s3
         # self.dataset_s3_client = boto3.client(
@@ -58,24 +191,29 @@ class DVCWorker:
 
     def create_directory_if_not_exists(self, path: Path):
         """檢查目錄是否存在，如果不存在則創建它"""
-        path.resolve()
-        if not path.exists():
+        # 直接 mkdir，目錄已存在時由 FileExistsError 判斷，不需先 exists() 再 mkdir
+        try:
+            path.mkdir(parents=True)
             self.logger.info(f"Directory {path} does not exist. Creating it.")
-            path.mkdir(parents=True, exist_ok=True)
             self.logger.info(f"Directory {path} created.")
-        else:
+        except FileExistsError:
             self.logger.info(f"Directory {path} already exists.")
  
     def ensure_git_repository(self):
         """確保指定路徑是一个 Git 倉庫，並配置 Git 遠程倉庫"""
+        if self._git_initialized:
+            return
+
         git_dir = self.git_repo_path / ".git"
         
         if not git_dir.exists():
             self.logger.info(f"Directory {self.git_repo_path} is not a Git repository. Initializing a new Git repository.")
-            subprocess.run(['git', 'init'], check=True, cwd=self.git_repo_path)
+            self.git_repo = pygit2.init_repository(str(self.git_repo_path))
             self.logger.info(f"Initialized empty Git repository in {self.git_repo_path}")
         else:
             self.logger.info(f"Directory {self.git_repo_path} is already a Git repository.")
+            self.git_repo = pygit2.Repository(str(self.git_repo_path))
+        self._git_initialized = True
 
     def ensure_dvc_repository(self, folder_path: Path, stage_type:str):
         """確保指定路徑是一个 DVC 倉庫，使用 --no-scm 選項"""
@@ -91,29 +229,53 @@ class DVCWorker:
             # 檢查並創建 MinIO bucket（如果不存在）
             if not self.bucket_exists(appointed_bucket):
                 self.s3_client.create_bucket(Bucket=appointed_bucket)
+                self._known_buckets.add(appointed_bucket)
                 self.logger.info(f"Bucket {appointed_bucket} created")
             else:
                 self.logger.info(f"Bucket {appointed_bucket} already exists")
 
             remote_path = f's3://{appointed_bucket}/{self.dag_id}_{self.execution_id}/{service_type}/dataset'
-            subprocess.run(['dvc', 'remote', 'add', '-d', self.remote_name, remote_path, '--force'], check=True, cwd=project_path)
-            subprocess.run(['dvc', 'remote', 'modify', self.remote_name, 'endpointurl', self.minio_url], check=True, cwd=project_path)
-            subprocess.run(['dvc', 'remote', 'modify', self.remote_name, 'access_key_id', self.access_key], check=True, cwd=project_path)
-            subprocess.run(['dvc', 'remote', 'modify', self.remote_name, 'secret_access_key', self.secret_key], check=True, cwd=project_path)
-            subprocess.run(['dvc', 'remote', 'modify', self.remote_name, 'use_ssl', 'false'], check=True, cwd=project_path)
+            # 等同 dvc remote add -d --force + 四次 dvc remote modify，一次寫入 .dvc/config
+            repo = self._get_dvc_repo(project_path)
+            with repo.config.edit() as conf:
+                conf["remote"][self.remote_name] = {
+                    "url": remote_path,
+                    "endpointurl": self.minio_url,
+                    "access_key_id": self.access_key,
+                    "secret_access_key": self.secret_key,
+                    "use_ssl": "false"
+                }
+                conf["core"]["remote"] = self.remote_name
             self.logger.info(f"Configured MinIO {remote_path} as remote storage for DVC at {project_path}")
             return {"status": "success", "message": "DVC initialized and MinIO remote configured successfully."}
-        except subprocess.CalledProcessError as e:
+        except DvcException as e:
             return {"status": "error", "message": str(e)}
         except Exception as e:
             return {"status": "error", "message": str(e)}
 
+    def _get_dvc_repo(self, dvc_repo_path: Path):
+        """取得指定路徑的 DVC Repo (第一次使用時開啟並快取)"""
+        dvc_repo_path = Path(dvc_repo_path)
+        with self._dvc_repo_locks_guard:
+            repo = self._dvc_repos.get(dvc_repo_path)
+            if repo is None:
+                repo = Repo(str(dvc_repo_path), config={"core": {"checksum_jobs": DVC_CHECKSUM_JOBS}})
+                self._dvc_repos[dvc_repo_path] = repo
+            return repo
+
     def bucket_exists(self, bucket_name: str) -> bool:
-        """檢查 MinIO bucket 是否存在"""
+        """檢查 MinIO bucket 是否存在 (存在的結果會被快取)"""
+        if bucket_name in self._known_buckets:
+            return True
         try:
             self.s3_client.head_bucket(Bucket=bucket_name)
+            self._known_buckets.add(bucket_name)
             return True
-        except self.s3_client.exceptions.NoSuchBucket:
+        except ClientError as e:
+            # head_bucket 沒有 response body，bucket 不存在時回傳的是 404 而不是 NoSuchBucket
+            if e.response["Error"]["Code"] in ("404", "NoSuchBucket"):
+                return False
+            self.logger.error(f"Error checking bucket existence: {str(e)}")
             return False
         except Exception as e:
             self.logger.error(f"Error checking bucket existence: {str(e)}")
@@ -121,13 +283,14 @@ class DVCWorker:
 
     def initialize_dvc(self, dvc_repo_path: str, stage_type:str):
         """初始化指定路徑的 DVC 倉庫，並配置 MinIO 作為remote storage"""
-        dvc_repo_path = Path(dvc_repo_path).resolve()
+        dvc_repo_path = _resolve(dvc_repo_path)
         dvc_path = dvc_repo_path / ".dvc"
         service_type = stage_type
 
         if not dvc_path.exists():
             self.logger.debug(f"Initializing DVC repository at {dvc_repo_path}")
-            subprocess.run(["dvc", "init", "--no-scm"], check=True, cwd=dvc_repo_path)
+            # 之後由 _get_dvc_repo 以 checksum_jobs 設定重新開啟
+            Repo.init(str(dvc_repo_path), no_scm=True).close()
 
         # 確保 Git 倉庫已經初始化
         self.ensure_git_repository()
@@ -145,118 +308,280 @@ class DVCWorker:
 
         return config_result
     
-    def add(self, folder_path: str, folder_name: str , stage_type:str):
+    def stage_layout(self, folder_path: str, folder_name: str, stage_type: str) -> StageLayout:
+        """取得產物資料夾對應的 StageLayout (第一次使用時計算並快取)"""
+        folder_path = _resolve(folder_path)
+        key = (folder_path, folder_name, stage_type)
+        layout = self._stage_layouts.get(key)
+        if layout is None:
+            dvc_file_name = f"{folder_name}.dvc"
+            # .dvc 檔在 git repo 中的位置 [GIT_LOCAL_REPO_FOR_DVC/{dagid_exeid}/{stag_type}/產物資料夾]
+            git_stage_dir = _resolve(self.git_repo_path / stage_type / f'{stage_type}_{folder_name}')
+            layout = StageLayout(
+                folder_path=folder_path,
+                parent_dir=folder_path.parent,
+                dvc_file=folder_path.parent / dvc_file_name,
+                git_stage_dir=git_stage_dir,
+                staged_dvc_file=git_stage_dir / dvc_file_name,
+                minio_key=f"{self.dag_id}_{self.execution_id}/{stage_type}/dvc_files/{dvc_file_name}",
+                # 放在 .git 底下，不會被 commit 進 git repo
+                state_file=self.git_repo_path / ".git" / "laststate" / f"{stage_type}_{folder_name}.hash"
+            )
+            self._stage_layouts[key] = layout
+        return layout
+
+    def add(self, folder_path: str, folder_name: str , stage_type:str, layout: StageLayout = None):
         """將指定文件夾(folder_path)添加到 DVC 管理中 並且複製紀錄檔至指定git repo"""
-        folder_path = Path(folder_path).resolve()
+        layout = layout or self.stage_layout(folder_path, folder_name, stage_type)
+        folder_path = layout.folder_path
 
         if not folder_path.exists():
             raise FileNotFoundError(f"The folder '{folder_path}' does not exist.")
 
         try:
             # 在當前文件夾路徑的上層目錄中執行 dvc add 操作，但只對指定的目錄執行操作
-            subprocess.run(['dvc', 'add', str(folder_path)], check=True, cwd=folder_path.parent)
+            self._get_dvc_repo(layout.parent_dir).add(str(folder_path))
             self.logger.info(f"Added {folder_name} to DVC tracking.")
 
             # 生成的 .dvc 文件路徑
-            dvc_file = Path(folder_path.parent / f"{folder_name}.dvc")
+            dvc_file = layout.dvc_file
             if dvc_file.exists():               
                 # 把產生的 .dvc檔 移動到指定的 repo [GIT_LOCAL_REPO_FOR_DVC/{dagid_exeid}/{stag_type}/產物資料夾]]
-                appointed_dvc_file_storage_folder = Path(self.git_repo_path / stage_type /f'{stage_type}_{folder_name}' ).resolve()
-                self.create_directory_if_not_exists(appointed_dvc_file_storage_folder)
-
-                shutil.copy(str(dvc_file), str(appointed_dvc_file_storage_folder))
+                self.create_directory_if_not_exists(layout.git_stage_dir)
+                self.link_or_copy_file(dvc_file, layout.staged_dvc_file)
 
-                # 配置的git repo資料夾 git add /git commit
-                self.git_add_commit_and_push(self.git_repo_path, f"Add {folder_name} dataset DVC file")
+                # 配置的git repo資料夾 git add /git commit (只暫存剛複製的 .dvc 檔，不重新掃描整個 repo)
+                self.git_add_commit_and_push(self.git_repo_path, f"Add {folder_name} dataset DVC file", paths=[layout.staged_dvc_file])
             else:
                 self.logger.error(f".dvc file not found for {folder_name}. Expected at {dvc_file}.")
                 return {"status": "error", "message": f".dvc file not found for {folder_name}."}
             
             return {"status": "success", "message": f"Folder {folder_name} added to DVC tracking and DVC file committed to Git."}
-        except subprocess.CalledProcessError as e:
+        except DvcException as e:
             self.logger.error(f"Error adding folder to DVC: {str(e)}")
             return {"status": "error", "message": str(e)}
+        except Exception as e:
+            self.logger.error(f"Unexpected error occurred while adding folder to DVC: {str(e)}")
+            return {"status": "error", "message": str(e)}
 
-    def push(self, folder_path: str):
-        """將指定 DVC 倉庫中的文件推送到remote storage"""
-        folder_path = Path(folder_path).resolve()
-        root_folder_path = Path(folder_path).parent.resolve()
+    def link_or_copy_file(self, src: Path, dst: Path):
+        """以 hardlink 將 src 放到 dst (同一個檔案系統時不需複製資料)，跨磁碟時改為複製
+
+        src 之後仍需用於 dvc push 及上傳 MinIO，所以不能直接 rename
+        """
+        # 先移除舊檔，避免 dst 已經是 src 的 hardlink 或舊版本
+        dst.unlink(missing_ok=True)
+        try:
+            os.link(src, dst)
+        except OSError:
+            _copy_file(src, dst)
+
+    def push(self, folder_path: str, jobs: int = None, layout: StageLayout = None):
+        """將指定 DVC 倉庫中的文件推送到remote storage
+
+        jobs 為同時上傳的檔案數 (None 時使用 DVC 預設值 4 * CPU 數)；大檔案由 DVC 以 multipart 分段上傳
+        """
+        if layout is not None:
+            folder_path = layout.folder_path
+            root_folder_path = layout.parent_dir
+        else:
+            folder_path = _resolve(folder_path)
+            root_folder_path = folder_path.parent
 
         try:
-            result = subprocess.run(['dvc', 'push'], check=True, text=True, capture_output=True, cwd=root_folder_path)
-            self.logger.info("Pushed data to remote storage.")
-            return {"status": "success", "stdout": result.stdout, "stderr": result.stderr}
-        except subprocess.CalledProcessError as e:
-            self.logger.error(f"Error pushing data to remote storage: Command '{e.cmd}' returned non-zero exit status {e.returncode}")
-            self.logger.error(f"Detailed error output:\nSTDOUT:\n{e.stdout}\nSTDERR:\n{e.stderr}")
-            return {"status": "error", "stdout": e.stdout, "stderr": e.stderr}
+            pushed = self._get_dvc_repo(root_folder_path).push(targets=[str(folder_path)], jobs=jobs)
+            self.logger.info(f"Pushed data to remote storage ({pushed} files).")
+            return {"status": "success", "message": f"Pushed {pushed} files to remote storage."}
+        except DvcException as e:
+            self.logger.error(f"Error pushing data to remote storage: {str(e)}")
+            return {"status": "error", "message": str(e)}
         except Exception as e:
             self.logger.error(f"Unexpected error occurred: {str(e)}")
             return {"status": "error", "message": str(e)}
     
-    def upload_dvc_file_to_minio(self, dvc_file_path: Path, stage_type: str):
+    def upload_dvc_file_to_minio(self, dvc_file_path: Path, stage_type: str, layout: StageLayout = None):
         """上傳 .dvc 文件到 MinIO """
         try:
             # 檢查 bucket 是否存在
             if not self.bucket_exists(self.minio_bucket):
                 self.logger.info(f"Bucket '{self.minio_bucket}' does not exist. Creating it.")
                 self.s3_client.create_bucket(Bucket=self.minio_bucket)
+                self._known_buckets.add(self.minio_bucket)
                 self.logger.info(f"Bucket '{self.minio_bucket}' created.")
 
-            target_path = f"{self.dag_id}_{self.execution_id}/{stage_type}/dvc_files/{dvc_file_path.name}"
-            self.s3_client.upload_file(str(dvc_file_path), self.minio_bucket, target_path)
+            if layout is not None:
+                target_path = layout.minio_key
+            else:
+                target_path = f"{self.dag_id}_{self.execution_id}/{stage_type}/dvc_files/{dvc_file_path.name}"
+            self.s3_client.upload_file(str(dvc_file_path), self.minio_bucket, target_path, Config=self.transfer_config)
             self.logger.info(f"Uploaded .dvc file to MinIO at {self.minio_bucket}/{target_path}")
             return {"status": "success", "message": f"Uploaded .dvc file to MinIO at {self.minio_bucket}/{target_path}"}
         except Exception as e:
             self.logger.error(f"Failed to upload .dvc file to MinIO: {str(e)}")
             return {"status": "error", "message": str(e)}
     
-    def add_and_push_data(self, folder_path: str, folder_name: str, stage_type: str):
+    def copy_dvc_within_minio(self, src_key: str, dst_key: str):
+        """在 MinIO 同一個 bucket 內以 server-side copy 複製 .dvc 文件，資料不經過本機
+
+        目前 server 端尚未使用，提供給需要在不同 key 之間搬移 .dvc 文件的呼叫端
+        """
+        try:
+            self.s3_client.copy({"Bucket": self.minio_bucket, "Key": src_key}, self.minio_bucket, dst_key, Config=self.transfer_config)
+            self.logger.info(f"Copied {self.minio_bucket}/{src_key} to {self.minio_bucket}/{dst_key}")
+            return {"status": "success", "message": f"Copied {src_key} to {dst_key} in MinIO."}
+        except Exception as e:
+            self.logger.error(f"Failed to copy {src_key} to {dst_key} in MinIO: {str(e)}")
+            return {"status": "error", "message": str(e)}
+
+    def copy_dvc_files_within_minio(self, key_pairs):
+        """並行執行多個 copy_dvc_within_minio，key_pairs 為 (src_key, dst_key) 的列表"""
+        key_pairs = list(key_pairs)
+        if not key_pairs:
+            return {"status": "success", "message": "No .dvc files to copy.", "results": []}
+
+        with ThreadPoolExecutor(max_workers=min(MAX_PARALLEL_TRANSFERS, len(key_pairs))) as executor:
+            results = list(executor.map(lambda pair: self.copy_dvc_within_minio(*pair), key_pairs))
+
+        failed = [result for result in results if result["status"] == "error"]
+        if failed:
+            return {"status": "error", "message": f"{len(failed)} of {len(results)} .dvc files failed to copy.", "results": results}
+        return {"status": "success", "message": f"Copied {len(results)} .dvc files in MinIO.", "results": results}
+
+    def add_and_push_data(self, folder_path: str, folder_name: str, stage_type: str, jobs: int = None):
         """將指定文件夾(folder path)添加到 DVC，推送到 MinIO， 並將 .dvc 文件提交到 Git"""
-        folder_path = Path(folder_path).resolve()
+        layout = self.stage_layout(folder_path, folder_name, stage_type)
 
-        if not folder_path.exists():
-            raise FileNotFoundError(f"The folder '{folder_path}' does not exist.")
+        if not layout.folder_path.exists():
+            raise FileNotFoundError(f"The folder '{layout.folder_path}' does not exist.")
 
-        # DVC ADD
-        add_result = self.add(folder_path, folder_name, stage_type)
-        if add_result["status"] == "error":
-            return add_result
+        with self._get_dvc_repo_lock(layout.parent_dir):
+            # 資料夾內容與上次成功推送時相同：整個 add → push → upload 都不需要執行
+            if layout.dvc_file.exists() and layout.state_file.exists():
+                if layout.state_file.read_text() == _folder_fingerprint(layout.folder_path):
+                    self.logger.info(f"Folder {folder_name} unchanged since last push. Skipping DVC add/push.")
+                    return {"status": "success", "message": f"Folder {folder_name} unchanged since last push. Nothing to do."}
 
-        # DVC PUSH
-        push_result = self.push(folder_path)
-        if push_result["status"] == "error":
-            return push_result
+            # DVC ADD
+            add_result = self.add(layout.folder_path, folder_name, stage_type, layout=layout)
+            if add_result["status"] == "error":
+                return add_result
+
+            # 在持有 repo 鎖時記下剛 add 的狀態 (包含 DVC 重新連結檔案造成的 mtime 變化)；push 期間新寫入的檔案不能算進去
+            added_fingerprint = _folder_fingerprint(layout.folder_path)
+
+            # add 之後 .dvc 內容與 MinIO 上的相同，代表資料已經推送過
+            if self.dvc_file_uploaded(layout):
+                self.logger.info(f"{layout.dvc_file.name} already uploaded to MinIO. Skipping DVC push and upload.")
+                self._save_folder_fingerprint(layout, added_fingerprint)
+                return {"status": "success", "message": f"Folder {folder_name} already pushed to remote storage. Nothing to do."}
+
+            # DVC PUSH
+            push_result = self.push(layout.folder_path, jobs=jobs, layout=layout)
+            if push_result["status"] == "error":
+                return push_result
 
         # 上傳 .dvc 文件到 MinIO 同一個 bucket 的不同資料夾
-        dvc_file = Path(folder_path.parent / f"{folder_name}.dvc")
-        upload_result = self.upload_dvc_file_to_minio(dvc_file, stage_type)
+        upload_result = self.upload_dvc_file_to_minio(layout.dvc_file, stage_type, layout=layout)
         if upload_result["status"] == "error":
             return upload_result
-        
+
+        self._save_folder_fingerprint(layout, added_fingerprint)
         return {"status": "success", "message": "Data added to DVC, pushed to remote storage, and .dvc file uploaded to MinIO."}
 
-    def git_add_commit_and_push(self, project_path: str, message: str):
-        """將指定路徑中的 .dvc 文件複製到统一的 Git 倉庫中，並提交和推送"""
+    def dvc_file_uploaded(self, layout: StageLayout) -> bool:
+        """比對本機 .dvc 檔的 MD5 與 MinIO 上同一個 key 的 ETag，判斷是否已上傳過相同內容"""
         try:
-            # 在 Git 本地倉庫中添加 .dvc 文件
-            subprocess.run(['git', 'add', '.'], check=True, cwd=self.git_repo_path)
-
-            # 檢查 Git 倉庫中是否有變化需要提交
-            result = subprocess.run(['git', 'status', '--porcelain'], check=True, text=True, capture_output=True, cwd=self.git_repo_path)
-            if not result.stdout.strip():
-                self.logger.info("No changes to commit in Git repository.")
-                return {"status": "success", "message": "No changes to commit in Git repository."}
+            response = self.s3_client.head_object(Bucket=self.minio_bucket, Key=layout.minio_key)
+        except ClientError as e:
+            if e.response["Error"]["Code"] not in ("404", "NoSuchKey"):
+                self.logger.warning(f"Error checking {layout.minio_key} in MinIO: {str(e)}")
+            return False
+        except BotoCoreError as e:
+            # 連線失敗或逾時：只是略過最佳化，照常 push 及上傳
+            self.logger.warning(f"Error checking {layout.minio_key} in MinIO: {str(e)}")
+            return False
+        # .dvc 檔遠小於 multipart 門檻，ETag 即為整個檔案的 MD5
+        local_md5 = hashlib.md5(layout.dvc_file.read_bytes()).hexdigest()
+        return response["ETag"].strip('"') == local_md5
 
-            # 提交更改到 Git 倉庫
-            subprocess.run(['git', 'commit', '-m', message], check=True, cwd=self.git_repo_path)
+    def _save_folder_fingerprint(self, layout: StageLayout, fingerprint: str):
+        """記錄 dvc add 當下的資料夾指紋，供下次 add_and_push_data 判斷是否有變化"""
+        layout.state_file.parent.mkdir(parents=True, exist_ok=True)
+        layout.state_file.write_text(fingerprint)
 
-            # 推送更改到remote storage（可選）
-            # subprocess.run(['git', 'push'], check=True, cwd=self.git_repo_path)
+    def add_and_push_many(self, items):
+        """並行對多個資料夾執行 add_and_push_data
 
-            self.logger.info("Committed and (optionally) pushed DVC changes to Git repository.")
-            return {"status": "success", "message": "Changes committed (and optionally pushed) to Git repository."}
-        except subprocess.CalledProcessError as e:
+        items 為 (folder_path, folder_name, stage_type[, jobs]) 的列表；不同 DVC repo 之間並行，同一個 repo 內依序執行
+        """
+        items = list(items)
+        if not items:
+            return {"status": "success", "message": "No folders to add and push.", "results": []}
+
+        results = []
+        with ThreadPoolExecutor(max_workers=min(MAX_PARALLEL_TRANSFERS, len(items))) as executor:
+            futures = [executor.submit(self.add_and_push_data, *item) for item in items]
+            for future in futures:
+                try:
+                    results.append(future.result())
+                except Exception as e:
+                    self.logger.error(f"Error adding and pushing folder: {str(e)}")
+                    results.append({"status": "error", "message": str(e)})
+
+        failed = [result for result in results if result["status"] == "error"]
+        if failed:
+            return {"status": "error", "message": f"{len(failed)} of {len(results)} folders failed to add and push.", "results": results}
+        return {"status": "success", "message": f"{len(results)} folders added to DVC, pushed to remote storage, and .dvc files uploaded to MinIO.", "results": results}
+
+    def _get_dvc_repo_lock(self, dvc_repo_path: Path):
+        """取得指定 DVC repo 的鎖 (不存在則建立)"""
+        with self._dvc_repo_locks_guard:
+            return self._dvc_repo_locks.setdefault(dvc_repo_path, threading.Lock())
+
+    def git_add_commit_and_push(self, project_path: str, message: str, paths=None):
+        """將指定路徑中的 .dvc 文件複製到统一的 Git 倉庫中，並提交和推送
+
+        透過 pygit2 直接操作 index 與 commit，不啟動 git 子行程；有指定 paths 時只暫存這些檔案，不重新掃描整個工作目錄
+        """
+        try:
+            # git index 為共用資源，並行呼叫時需依序 commit
+            with self._git_lock:
+                index = self.git_repo.index
+                # 若 index 在磁碟上被其他程式修改過才重新讀取
+                index.read(force=False)
+
+                # 在 Git 本地倉庫中添加 .dvc 文件
+                if paths:
+                    for path in paths:
+                        index.add(_resolve(path).relative_to(self.git_repo_path).as_posix())
+                else:
+                    index.add_all()
+                index.write()
+                tree_id = index.write_tree()
+
+                # 檢查 Git 倉庫中是否有變化需要提交 (比對 index 的 tree 與 HEAD 的 tree)
+                parents = []
+                if self.git_repo.head_is_unborn and len(index) == 0:
+                    # 尚無任何 commit 且 index 為空：不建立空的 root commit
+                    self.logger.info("No changes to commit in Git repository.")
+                    return {"status": "success", "message": "No changes to commit in Git repository."}
+                if not self.git_repo.head_is_unborn:
+                    head_commit = self.git_repo.head.peel(pygit2.Commit)
+                    if head_commit.tree_id == tree_id:
+                        self.logger.info("No changes to commit in Git repository.")
+                        return {"status": "success", "message": "No changes to commit in Git repository."}
+                    parents = [head_commit.id]
+
+                # 提交更改到 Git 倉庫 (使用 git config 中的 user.name / user.email)
+                signature = self.git_repo.default_signature
+                self.git_repo.create_commit('HEAD', signature, signature, message, tree_id, parents)
+
+                # 推送更改到remote storage（可選）
+                # subprocess.run(['git', 'push'], check=True, cwd=self.git_repo_path)
+
+                self.logger.info("Committed and (optionally) pushed DVC changes to Git repository.")
+                return {"status": "success", "message": "Changes committed (and optionally pushed) to Git repository."}
+        except (pygit2.GitError, OSError, KeyError, ValueError) as e:
             self.logger.error(f"Error committing (and pushing) to Git: {str(e)}")
             return {"status": "error", "message": str(e)}
 
@@ -265,7 +590,7 @@ class DVCWorker:
         try:
             # 在 MinIO 中找到對應的路徑
             minio_key = f"{stage_type}/{dvc_filename}"
-            self.s3_client.download_file(self.minio_bucket, minio_key, str(target_path))
+            self.s3_client.download_file(self.minio_bucket, minio_key, str(target_path), Config=self.transfer_config)
             self.logger.info(f"Downloaded {dvc_filename} from MinIO to {target_path}")
         except Exception as e:
             self.logger.error(f"Failed to download {dvc_filename} from MinIO: {str(e)}")
@@ -273,7 +598,7 @@ class DVCWorker:
         
     def pull(self, stage_type: str, dvc_filename: str, folder_path: str):
         """从 MinIO 拉取指定 .dvc 文件的内容到指定路徑，並根據.dvc 文件下載數據"""
-        folder_path = Path(folder_path).resolve()
+        folder_path = _resolve(folder_path)
         
         try:
             # 確保指定路徑存在
@@ -289,7 +614,7 @@ class DVCWorker:
             
             try:
                 self.logger.info(f"Downloading .dvc file from MinIO: {dvc_file_key} to {local_dvc_file_path}")
-                self.s3_client.download_file(self.minio_bucket, dvc_file_key, str(local_dvc_file_path))
+                self.s3_client.download_file(self.minio_bucket, dvc_file_key, str(local_dvc_file_path), Config=self.transfer_config)
                 self.logger.info(f"Downloaded {dvc_filename} to {local_dvc_file_path}")
             except Exception as e:
                 self.logger.error(f"Failed to download .dvc file from MinIO: {str(e)}")
@@ -297,12 +622,12 @@ class DVCWorker:
 
             # DVC PULL 
             try:
-                result = subprocess.run(['dvc', 'pull', str(local_dvc_file_path)], check=True, text=True, capture_output=True, cwd=folder_path)
+                stats = self._get_dvc_repo(folder_path).pull(targets=[str(local_dvc_file_path)])
                 self.logger.info(f"Pulled data from remote storage for {dvc_filename}.")
-                return {"status": "success", "stdout": result.stdout, "stderr": result.stderr}
-            except subprocess.CalledProcessError as e:
+                return {"status": "success", "message": f"Pulled data for {dvc_filename}.", "stats": stats}
+            except DvcException as e:
                 self.logger.error(f"Error pulling data from remote storage: {str(e)}")
-                return {"status": "error", "stdout": e.stdout, "stderr": e.stderr}
+                return {"status": "error", "message": str(e)}
 
         except FileNotFoundError as e:
             self.logger.error(f"File not found: {str(e)}")
@@ -311,6 +636,30 @@ class DVCWorker:
             self.logger.error(f"Error during pull operation: {str(e)}")
             return {"status": "error", "message": str(e)}
 
+    async def pull_many(self, items):
+        """並行執行多個 pull，items 為 (stage_type, dvc_filename, folder_path) 的列表
+
+        每個 pull 在執行緒中執行，讓 .dvc 下載與 dvc pull 的網路等待互相重疊；同一個 DVC repo 內依序執行
+        """
+        items = list(items)
+        semaphore = asyncio.Semaphore(MAX_PARALLEL_TRANSFERS)
+
+        async def pull_one(stage_type, dvc_filename, folder_path):
+            async with semaphore:
+                return await asyncio.to_thread(self._pull_with_repo_lock, stage_type, dvc_filename, folder_path)
+
+        results = await asyncio.gather(*[pull_one(*item) for item in items])
+
+        failed = [result for result in results if result["status"] == "error"]
+        if failed:
+            return {"status": "error", "message": f"{len(failed)} of {len(results)} .dvc files failed to pull.", "results": results}
+        return {"status": "success", "message": f"Pulled data for {len(results)} .dvc files.", "results": results}
+
+    def _pull_with_repo_lock(self, stage_type: str, dvc_filename: str, folder_path: str):
+        """持有目標 DVC repo 的鎖執行 pull"""
+        with self._get_dvc_repo_lock(_resolve(folder_path)):
+            return self.pull(stage_type, dvc_filename, folder_path)
+
     """
     usage for dataset download sepecifically
     """
@@ -327,7 +676,8 @@ class DVCWorker:
             self.dataset_storage_minio_url,
             access_key=self.dataset_storage_minio_access_key,
             secret_key=self.dataset_storage_minio_secret_key,
-            secure=False  # 如果 MinIO 沒有 SSL，設置為 False
+            secure=False,  # 如果 MinIO 沒有 SSL，設置為 False
+            http_client=_minio_http_client()
         )
 
     # 解析 DVC 檔案並獲取 outs 路徑
@@ -376,23 +726,30 @@ class DVCWorker:
         remote_access_key=self.dataset_storage_minio_access_key
         remote_secret_key = self.dataset_storage_minio_secret_key
         
-        subprocess.run(["dvc", "remote", "add", "-f", remote_name, remote_minio_url])
-        subprocess.run(["dvc", "remote", "modify", remote_name, "access_key_id", remote_access_key])
-        subprocess.run(["dvc", "remote", "modify", remote_name, "secret_access_key", remote_secret_key])
-        subprocess.run(["dvc", "remote", "modify", remote_name, "endpointurl", f"http://{remote_url}"])
-        
-        # **設定 DVC 預設遠端**
-        subprocess.run(["dvc", "remote", "default", remote_name])
+        # 等同 dvc remote add -f + 三次 dvc remote modify + dvc remote default，一次寫入 .dvc/config
+        with Repo(os.curdir) as repo:
+            with repo.config.edit() as conf:
+                conf["remote"][remote_name] = {
+                    "url": remote_minio_url,
+                    "access_key_id": remote_access_key,
+                    "secret_access_key": remote_secret_key,
+                    "endpointurl": f"http://{remote_url}"
+                }
+                # **設定 DVC 預設遠端**
+                conf["core"]["remote"] = remote_name
         self.logger.info(f"Set DVC default remote: {remote_name}")
 
-        # DVC Pull
-        result = subprocess.run(["dvc", "pull"], capture_output=True, text=True)
-        self.logger.info("DVC Pull Output:", result.stdout)
-        self.logger.info("DVC Pull Error:", result.stderr)
+        # DVC Pull：stderr 併入 stdout 逐行寫入 log，不把整份輸出留在記憶體，也不會因 pipe 塞滿而卡住
+        pull_failed = False
+        with subprocess.Popen(["dvc", "pull"], stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True) as process:
+            for line in process.stdout:
+                self.logger.info(f"DVC Pull: {line.rstrip()}")
+                if "failed to pull data from the cloud" in line:
+                    pull_failed = True
         self.logger.info("DVC Pull Completed")
 
         # 檢查 DVC Pull 結果
-        if "failed to pull data from the cloud" in result.stderr:
+        if pull_failed:
             self.logger.error("Failed to pull data from the cloud. Check if the cache is up to date")
             raise HTTPException(status_code=500, detail="Failed to pull data from the cloud. Check if the cache is up to date.")
         
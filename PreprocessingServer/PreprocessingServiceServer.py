@@ -15,7 +15,7 @@ from DVCWorker import DVCWorker
 from typing import Dict
 from LoggerManager import LoggerManager
 from DagManager import DagManager
-import config
+from config import CFG
 import redis
 import socket
 import json
@@ -247,7 +247,7 @@ async def download_dataset(request:DagRequest):
     try:
 
         # 1.根據dataset_name & dataset_version 去跟dataset management service 取得該資料及該版本詳細資訊 (dvc file url)
-        dataset_management_url = config.DMS_SERVICE_URL  # 替換為你的服務 URL
+        dataset_management_url = CFG.dms_service_url  # 替換為你的服務 URL
         endpoint = f"{dataset_management_url}/datasets/{dataset_name}/versions/{dataset_version}"
 
         logger.info(f"Fetching dataset details from Dataset Management Service: {endpoint}")
@@ -675,7 +675,8 @@ async def upload_log_to_s3(request: DagRequest):
         dvc_worker.s3_client.upload_file(
             Filename=str(log_file_path),
             Bucket=dvc_worker.minio_bucket,
-            Key=target_path
+            Key=target_path,
+            Config=dvc_worker.transfer_config
         )
 
         logger.info("Log file uploaded successfully.")
@@ -1,25 +1,32 @@
 # config.py
+from dataclasses import dataclass
 
-# Server Manager Configuration
-SERVER_MANAGER_URL = "http://10.52.52.136:8000"
-
-# Machine Configuration
-MACHINE_ID = "machine_server_1"
-MACHINE_IP = "10.52.52.136"
-MACHINE_PORT = 8085
-MACHINE_CAPACITY = 2
-
-# MinIO Configuration
-MINIO_URL = "http://10.52.52.138:31000"
-MINIO_BUCKET = "testdvcfilemanagementfordag"
-MINIO_ACCESS_KEY = "testdvctominio"
-MINIO_SECRET_KEY = "testdvctominio"
-
-# Dataset Management Service Configuration
-DMS_SERVICE_URL = "http://10.52.52.138:8088"
-
-# MinIO Configuration for dataset
-DATASET_STORAGE_MINIO_URL = "10.52.52.138:31000"
-DATASET_STORAGE_MINIO_BUCKET = "mock-dataset"
-DATASET_STORAGE_MINIO_ACCESS_KEY = "testdvctominio"
-DATASET_STORAGE_MINIO_SECRET_KEY = "testdvctominio"
+
+@dataclass(frozen=True, slots=True)
+class Config:
+    # Server Manager Configuration
+    server_manager_url: str = "http://10.52.52.136:8000"
+
+    # Machine Configuration
+    machine_id: str = "machine_server_1"
+    machine_ip: str = "10.52.52.136"
+    machine_port: int = 8085
+    machine_capacity: int = 2
+
+    # MinIO Configuration
+    minio_url: str = "http://10.52.52.138:31000"
+    minio_bucket: str = "testdvcfilemanagementfordag"
+    minio_access_key: str = "testdvctominio"
+    minio_secret_key: str = "testdvctominio"
+
+    # Dataset Management Service Configuration
+    dms_service_url: str = "http://10.52.52.138:8088"
+
+    # MinIO Configuration for dataset
+    dataset_storage_minio_url: str = "10.52.52.138:31000"
+    dataset_storage_minio_bucket: str = "mock-dataset"
+    dataset_storage_minio_access_key: str = "testdvctominio"
+    dataset_storage_minio_secret_key: str = "testdvctominio"
+
+
+CFG = Config()